@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import atexit
+import io
 import json
 import logging
+import os
+import queue
+import time as time_
 from datetime import date as date_, datetime
+from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-from typing import Any
+from typing import Any, BinaryIO, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+_log_listener: QueueListener | None = None
+
+_VALID_KEYS = frozenset(
+    ("title", "author", "description", "revision_date", "contents")
+)
 
 
 class NotADictionaryError(Exception):
@@ -42,7 +61,7 @@ def new(
         "title": title,
         "author": author,
         "description": description,
-        "revision_date": str(date_.today()),
+        "revision_date": date(),
         "contents": {},
     }
 
@@ -50,6 +69,9 @@ def new(
 def validate_dict(content: dict[str, Any]) -> bool:
     """Validates if a ``dict`` is a dictionary.
 
+    It must have exactly the keys of a dictionary, with ``str`` values except
+    for ``contents``, which must be a ``dict``.
+
     Parameters
     ----------
     content : dict[str, Any]
@@ -61,15 +83,13 @@ def validate_dict(content: dict[str, Any]) -> bool:
         Returns ``True`` if it is a dictionary, and is ``False`` otherwise
     """
 
-    VALID_KEYS = {
-        "title",
-        "author",
-        "description",
-        "revision_date",
-        "contents",
-    }
-    return all(key in VALID_KEYS for key in content.keys()) and all(
-        key in content.keys() for key in VALID_KEYS
+    return (
+        content.keys() == _VALID_KEYS
+        and isinstance(content["contents"], dict)
+        and isinstance(content["title"], str)
+        and isinstance(content["author"], str)
+        and isinstance(content["description"], str)
+        and isinstance(content["revision_date"], str)
     )
 
 
@@ -88,26 +108,62 @@ def read_json(path: str) -> dict[str, Any]:
 
     Raises
     ------
+    FileNotFoundError
+        Raised when the path is not an existing file.
+
     JSONDecodeError
         Raised when the file cannot be parsed as JSON.
 
     NotADictionaryError
         Raised when the file cannot be parsed as a dictionary.
     """
-    file_path = Path(path)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+
+    # The document is read and parsed eagerly in one call each. ``Dictionary``
+    # is a ``dict`` subclass that copies ``contents`` on initialization, so a
+    # lazy parser would have its whole document materialized right away
+    # anyway. The file is opened unbuffered since ``read()`` then sizes a
+    # single read from the file size instead of going through a buffer.
+    with open(path, "rb", buffering=0) as f:
+        file_contents: dict[str, Any] = _loads(f.read())
+
+    if not validate_dict(file_contents):
+        raise NotADictionaryError(
+            path, "JSON content invalid to be dictionary"
+        )
 
-    if not file_path.exists():
-        raise FileNotFoundError
+    return file_contents
 
-    with open(path) as f:
-        file_contents: dict[str, Any] = json.load(f)
 
-        if not validate_dict(file_contents):
-            raise NotADictionaryError(
-                path, "JSON content invalid to be dictionary"
-            )
+def _loads(data: bytes) -> Any:
+    """Parses JSON bytes, using ``orjson`` if it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-    return file_contents
+
+def _dump(content: Any, f: BinaryIO) -> None:
+    """Writes indented JSON with sorted keys to a binary file, using
+    ``orjson`` if it is installed. Both backends produce the same output.
+
+    ``orjson`` serializes the whole document in a single call. The ``json``
+    module is streamed chunk by chunk instead, so the document is never held
+    in memory as a whole.
+    """
+    if orjson is not None:
+        f.write(
+            orjson.dumps(
+                content, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+        )
+    else:
+        encoder = json.JSONEncoder(
+            ensure_ascii=False, indent=2, sort_keys=True
+        )
+        f.writelines(
+            chunk.encode("utf-8") for chunk in encoder.iterencode(content)
+        )
 
 
 # TODO: Find a save-by-appending method for large files
@@ -123,27 +179,98 @@ def save_all_to_file(content: dict[str, Any], path: str) -> None:
     path : str
         The path of the JSON file.
     """
-    with open(path, "w") as f:
-        json.dump(content, f, indent=4, sort_keys=True)
+    with open(path, "wb") as f:
+        _dump(content, f)
+
+
+def serialize(content: dict[str, Any]) -> bytes:
+    """Serializes the entire content the same way it is saved to a file.
+
+    Parameters
+    ----------
+    content : dict[str, Any]
+        The content to be serialized.
+
+    Returns
+    -------
+    bytes
+        The JSON document.
+    """
+    buffer = io.BytesIO()
+    _dump(content, buffer)
+    return buffer.getvalue()
+
+
+def save_serialized_to_file(data: bytes, path: str) -> None:
+    """Saves serialized content to the JSON file.
+
+    The data is written to a temporary file first, which then replaces the
+    JSON file, so the file is never left partially written.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized content, as returned by ``serialize``.
+    path : str
+        The path of the JSON file.
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
 
 
 def config_log(path: str) -> None:
     """Sets the configuration for the logging module.
 
+    Like ``logging.basicConfig``, this does nothing if the root logger already
+    has handlers. The log file is written by a background thread, so logging
+    never waits on the disk.
+
     Parameters
     ----------
     path : str
         The path of the dictionary file.
     """
+    global _log_listener
+
+    if logging.getLogger().handlers:
+        return
+
+    file_handler = logging.FileHandler(Path(path).with_suffix(".log"))
+    file_handler.setFormatter(
+        logging.Formatter(
+            fmt="[%(asctime)s] [%(levelname)s] %(message)s",
+            datefmt="%m/%d/%Y %I:%M:%S %p",
+        )
+    )
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
     logging.basicConfig(
-        filename=Path(path).with_suffix(".log"),
-        format="[%(asctime)s] [%(levelname)s] %(message)s",
-        datefmt="%m/%d/%Y %I:%M:%S %p",
+        handlers=[QueueHandler(log_queue)],
+        format="%(message)s",
         level=logging.DEBUG,
     )
 
 
+def _per_second(func: Callable[[], str]) -> Callable[[], str]:
+    """Caches the result of a timestamp function until the second ticks."""
+    last: list[Any] = [None, ""]
+
+    @wraps(func)
+    def wrapper() -> str:
+        second = int(time_.time())
+        if second != last[0]:
+            last[:] = [second, func()]
+        return last[1]
+
+    return wrapper
+
+
+@_per_second
 def date() -> str:
     """Returns the current date.
 
@@ -155,6 +282,7 @@ def date() -> str:
     return str(date_.today())
 
 
+@_per_second
 def time() -> str:
     """Returns the current time.
 
@@ -166,6 +294,7 @@ def time() -> str:
     return str(datetime.now().time()).split(".")[0]
 
 
+@_per_second
 def date_time() -> str:
     """Returns the current date and time.
 
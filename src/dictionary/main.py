@@ -1,15 +1,31 @@
 from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 
+import itertools
 import logging
-import re
-from typing import Any
-from pathlib import Path
+import os
+import sys
+import threading
+from typing import Any, Iterable, Sequence
 
-from jellyfish import damerau_levenshtein_distance
+from rapidfuzz import process
+from rapidfuzz.distance import OSA, DamerauLevenshtein
 
 from . import file_ops
 
+logger = logging.getLogger(__name__)
+
+_saver = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dictionary")
+
+# Saves are numbered in the order they are requested, and a file is only
+# written if no later save of it was written first.
+_save_order = itertools.count()
+_save_lock = threading.Lock()
+_last_saves: dict[str, int] = {}
+
+_SEARCH_CACHE_SIZE = 1024
+
 
 class SearchMode(Enum):
     """Search modes for the ``search`` method of the class ``Dictionary``."""
@@ -27,7 +43,112 @@ class InfoType(Enum):
     References = 1
 
 
+def _closest(
+    keyword: str,
+    keys: Sequence[str],
+    compared: Sequence[str],
+    max_results: int,
+) -> list[tuple[str, int]]:
+    """Returns the keys closest to ``keyword`` by Damerau-Levenshtein distance.
+
+    The distances are computed by ``rapidfuzz`` in a single batched call,
+    and ties are broken by the order of the keys.
+
+    If there are more keys than ``max_results``, the much cheaper optimal
+    string alignment distance, which is never smaller, is ranked first. Its
+    ``max_results``-th best distance bounds the results, and is passed as
+    the cutoff so that farther keys are abandoned early.
+
+    Parameters
+    ----------
+    keyword : str
+        The string to be compared against.
+    keys : Sequence[str]
+        The keys to be ranked.
+    compared : Sequence[str]
+        The strings the keys are compared as, in the same order as ``keys``.
+    max_results : int
+        The maximum number of keys returned.
+
+    Returns
+    -------
+    list[tuple[str, int]]
+        The closest keys and their distances, from the closest.
+    """
+    cutoff = None
+    if len(compared) > max_results:
+        cutoff = process.extract(
+            keyword, compared, scorer=OSA.distance, limit=max_results
+        )[-1][1]
+
+    return [
+        (keys[index], distance)
+        for _, distance, index in process.extract(
+            keyword,
+            compared,
+            scorer=DamerauLevenshtein.distance,
+            limit=max_results,
+            score_cutoff=cutoff,
+        )
+    ]
+
+
+def _write_in_order(order: int, data: bytes, path: str) -> bool:
+    """Writes serialized content to a file, unless a later save of the same
+    file was written first.
+
+    Parameters
+    ----------
+    order : int
+        The number of the save, taken from ``_save_order`` when it was
+        requested.
+    data : bytes
+        The serialized content, as returned by ``file_ops.serialize``.
+    path : str
+        The path of the JSON file.
+
+    Returns
+    -------
+    bool
+        Returns ``True`` if the file was written, and ``False`` if the save
+        was outdated.
+    """
+    key = os.path.abspath(path)
+    with _save_lock:
+        if _last_saves.get(key, -1) > order:
+            return False
+        file_ops.save_serialized_to_file(data, path)
+        _last_saves[key] = order
+    return True
+
+
+class _Meta:
+    """The metadata of a ``Dictionary``, kept apart from its contents."""
+
+    __slots__ = ("title", "author", "description", "revision_date")
+
+    def __init__(
+        self, title: str, author: str, description: str, revision_date: str
+    ) -> None:
+        self.title = title
+        self.author = author
+        self.description = description
+        self.revision_date = revision_date
+
+
 class Dictionary(dict):
+    __slots__ = (
+        "__meta",
+        "__path",
+        "__file_name",
+        "__keys",
+        "__lower_keys",
+        "__lower_index",
+        "__search_cache",
+        "__edited",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         path: str,
@@ -52,24 +173,29 @@ class Dictionary(dict):
             The description of the new dictionary, by default ""
         """
         file_content: dict[str, Any]
-        path_details = Path(path)
+        is_file = os.path.isfile(path)
 
-        if path_details.exists():
-            if not path_details.is_file():
-                raise FileNotFoundError
+        if is_file:
             file_content = file_ops.read_json(path)
+        elif os.path.exists(path):
+            raise FileNotFoundError(path)
         else:
             file_content = file_ops.new(title, author, description)
 
-        for key, value in file_content.items():
-            assert isinstance(key, str)
-            assert isinstance(value, (str, dict))
-
-        self.__title: str = file_content.pop("title")
-        self.__author: str = file_content.pop("author")
-        self.__description: str = file_content.pop("description")
-        self.__revision_date: str = file_content.pop("revision_date")
+        self.__meta = _Meta(
+            file_content["title"],
+            file_content["author"],
+            file_content["description"],
+            file_content["revision_date"],
+        )
         self.__path = path
+        self.__file_name = os.path.basename(path)
+        self.__keys: list[str] | None = None
+        self.__lower_keys: list[str] | None = None
+        self.__lower_index: dict[str, str] | None = None
+        self.__search_cache: dict[
+            tuple[str, bool, SearchMode, int], list[tuple[str, int]]
+        ] = {}
 
         super().__init__(file_content["contents"])
 
@@ -77,15 +203,15 @@ class Dictionary(dict):
 
         file_ops.config_log(path)
 
-        if not path_details.is_file():
-            logging.info(f"Created new dictionary {path_details.parts[-1]}.")
+        if not is_file:
+            logger.info("Created new dictionary %s.", self.__file_name)
 
-        logging.info(f"Initialized {path}.")
+        logger.info("Initialized %s.", path)
 
     def __delitem__(self, __v: str) -> None:
         """An invalidation of the inherited ``__delitem__`` method to
         avoid data destruction."""
-        logging.warning(f"Attempted to use __delitem__ on {self.path}")
+        logger.warning("Attempted to use __delitem__ on %s", self.path)
         raise NotImplementedError
 
     def pop(self, __k, __d=None) -> Any:
@@ -95,54 +221,171 @@ class Dictionary(dict):
         raise NotImplementedError
 
     def __setitem__(self, __k, __v) -> None:
-        def validate_kwcontent(__v: dict[Any, Any]) -> bool:
-            VALID_KEYS = ("definitions", "references")
-            return all(key in VALID_KEYS for key in __v) and all(
-                key in __v for key in VALID_KEYS
-            )
+        self._validate_new_entry(__k, __v)
+        # Keywords are interned, so later lookups with the same keyword can
+        # match by identity before comparing strings.
+        key = sys.intern(str(__k))
+        super().__setitem__(key, __v)
+        self._key_added(key)
+
+    def _validate_new_entry(self, __k: Any, __v: Any) -> None:
+        """Validates a keyword and its content before they are added.
+
+        Raises
+        ------
+        NotImplementedError
+            Raised if the keyword is not a ``str`` or already exists, or if
+            the content is not a ``dict`` with exactly the keys
+            ``definitions`` and ``references``.
+        """
+        VALID_KEYS = ("definitions", "references")
 
-        if not isinstance(__k, str):
+        if not isinstance(__k, str) or __k in self:
             raise NotImplementedError
 
-        if __k in self:
+        if not (
+            isinstance(__v, dict)
+            and all(key in VALID_KEYS for key in __v)
+            and all(key in __v for key in VALID_KEYS)
+        ):
             raise NotImplementedError
-        else:
-            if validate_kwcontent(__v):
-                super().__setitem__(__k, __v)
-            else:
-                raise NotImplementedError
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """An override of the inherited ``update`` method to add the keywords
+        through ``__setitem__``, so they are validated and searchable.
+
+        Every keyword and its content are validated before any is added, so
+        if one is invalid or already exists, ``NotImplementedError`` is raised
+        and the dictionary is left unchanged.
+        """
+        entries = dict(*args, **kwargs)
+        for key, value in entries.items():
+            self._validate_new_entry(key, value)
+        for key, value in entries.items():
+            self[key] = value
+
+    def setdefault(self, __k, __d=None) -> Any:
+        """An override of the inherited ``setdefault`` method to add the
+        keyword through ``__setitem__``, so it is validated and searchable.
+
+        As with ``__setitem__``, ``NotImplementedError`` is raised if the
+        keyword is new and ``__d`` is not valid content, including the default
+        ``None``.
+        """
+        if __k not in self:
+            self[__k] = __d
+        return self[__k]
+
+    def __ior__(self, __v: Any) -> Dictionary:  # type: ignore[misc]
+        """An override of the inherited ``|=`` operator to add the keywords
+        through ``__setitem__``, so they are validated and searchable."""
+        self.update(__v)
+        return self
 
     def popitem(self) -> tuple[str, Any]:
         """An invalidation of the inherited ``popitem`` method to avoid data
         destruction."""
-        logging.warning(f"Attempted to use ``pop`` method on {self.path}")
+        logger.warning("Attempted to use ``pop`` method on %s", self.path)
         raise NotImplementedError
 
     def clear(self) -> None:
         """An invalidation of the inherited ``clear`` method to avoid data
         destruction."""
-        logging.warning("Attempted to clear the dictionary")
+        logger.warning("Attempted to clear the dictionary")
         raise NotImplementedError
 
+    def __copy__(self) -> Dictionary:
+        """Returns a shallow copy of the dictionary.
+
+        The copy shares the entries of the dictionary, but has its own lookup
+        structures, since those are extended in place as keywords are added.
+        """
+        return self._restore(*self._state())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickles the dictionary as its state, so that it is unpickled
+        through ``_restore`` rather than item by item through
+        ``__setitem__``."""
+        return (self._restore, self._state())
+
+    def _state(self) -> tuple[str, str, str, str, str, dict[str, Any], bool]:
+        """Returns the arguments ``_restore`` rebuilds the dictionary from."""
+        return (
+            self.path,
+            self.title,
+            self.author,
+            self.description,
+            self.revision_date,
+            dict(self),
+            self.edited,
+        )
+
+    @classmethod
+    def _restore(
+        cls,
+        path: str,
+        title: str,
+        author: str,
+        description: str,
+        revision_date: str,
+        contents: dict[str, Any],
+        edited: bool,
+    ) -> Dictionary:
+        """Rebuilds a dictionary from its state, without reading its file.
+
+        Parameters
+        ----------
+        path : str
+            The path of the dictionary file.
+        title : str
+            The title of the dictionary.
+        author : str
+            The author of the dictionary.
+        description : str
+            The description of the dictionary.
+        revision_date : str
+            The date of the last revision of the dictionary.
+        contents : dict[str, Any]
+            The entries of the dictionary.
+        edited : bool
+            Whether the dictionary was edited since it was last saved.
+
+        Returns
+        -------
+        Dictionary
+            The rebuilt dictionary, with empty lookup structures.
+        """
+        self = cls.__new__(cls)
+        self.__meta = _Meta(title, author, description, revision_date)
+        self.__path = path
+        self.__file_name = os.path.basename(path)
+        self.__keys = None
+        self.__lower_keys = None
+        self.__lower_index = None
+        self.__search_cache = {}
+        dict.__init__(self, contents)
+        self.__edited = edited
+        return self
+
     @property
     def title(self) -> str:
         """The title of the dictionary."""
-        return self.__title
+        return self.__meta.title
 
     @property
     def author(self) -> str:
         """The author of the dictionary."""
-        return self.__author
+        return self.__meta.author
 
     @property
     def description(self) -> str:
         """The description of the dictionary."""
-        return self.__description
+        return self.__meta.description
 
     @property
     def revision_date(self) -> str:
         """The date of the last revision of the dictionary."""
-        return self.__revision_date
+        return self.__meta.revision_date
 
     @property
     def edited(self) -> bool:
@@ -170,13 +413,139 @@ class Dictionary(dict):
             "contents": self,
         }
 
+    def _keys(self) -> list[str]:
+        """Returns the keywords, in order.
+
+        The list is built on first use, extended as keywords are added, and
+        rebuilt after keywords are removed, so searches can pass it to
+        ``rapidfuzz`` as is. It must not be modified by the caller.
+
+        Returns
+        -------
+        list[str]
+            The keywords of the dictionary.
+        """
+        if self.__keys is None:
+            self.__keys = list(self)
+        return self.__keys
+
+    def _lowercase_keys(self) -> list[str]:
+        """Returns the lowercase forms of the keywords, in the same order as
+        ``_keys``.
+
+        Like ``_keys``, the list is built on first use.
+
+        Returns
+        -------
+        list[str]
+            The lowercase forms of the keywords.
+        """
+        if self.__lower_keys is None:
+            self.__lower_keys = [key.lower() for key in self._keys()]
+        return self.__lower_keys
+
+    def _lowercase_index(self) -> dict[str, str]:
+        """Returns the mapping of each lowercase form to its keyword.
+
+        If several keywords share a lowercase form, the first one is kept.
+        Like ``_lowercase_keys``, the mapping is built on first use.
+
+        Returns
+        -------
+        dict[str, str]
+            The keywords, keyed by their lowercase forms.
+        """
+        if self.__lower_index is None:
+            index: dict[str, str] = {}
+            for key, lowered in zip(self._keys(), self._lowercase_keys()):
+                index.setdefault(lowered, key)
+            self.__lower_index = index
+        return self.__lower_index
+
+    def _key_added(self, key: str) -> None:
+        """Extends the lookup structures built from the keywords with a new
+        keyword, and drops the cached search results."""
+        self.__search_cache.clear()
+        if self.__keys is None:
+            return
+        self.__keys.append(key)
+        if self.__lower_keys is None:
+            return
+        lowered = key.lower()
+        self.__lower_keys.append(lowered)
+        if self.__lower_index is not None:
+            self.__lower_index.setdefault(lowered, key)
+
+    def _keys_changed(self) -> None:
+        """Drops the lookup structures built from the keywords."""
+        self.__keys = None
+        self.__search_cache.clear()
+        self.__lower_keys = None
+        self.__lower_index = None
+
     def save(self) -> None:
-        """Saves the dictionary to its associated file, if it was edited."""
+        """Saves the dictionary to its associated file, if it was edited.
+
+        The file is written in the calling thread and replaced atomically.
+        Background saves from ``save_async`` that were requested earlier but
+        are still pending are then skipped, so they never overwrite it.
+        """
+        if self.edited:
+            self.__meta.revision_date = file_ops.date()
+            _write_in_order(
+                next(_save_order),
+                file_ops.serialize(self._convert_to_dict()),
+                self.path,
+            )
+        self.__edited = False
+        logger.info("Saved %s.", self.__file_name)
+
+    def save_async(self) -> Future[None]:
+        """Saves the dictionary to its associated file in the background, if
+        it was edited.
+
+        The dictionary is serialized before returning, so later edits are not
+        part of the save. The file is written by a single background thread
+        and replaced atomically, unless a later save of it was written first.
+        If the write fails, the dictionary is marked as edited again, and the
+        exception is raised by the returned future.
+
+        Returns
+        -------
+        Future[None]
+            The pending write, which is already done if nothing was edited.
+        """
+        future: Future[None]
         if self.edited:
-            self.__revision_date = file_ops.date()
-            file_ops.save_all_to_file(self._convert_to_dict(), self.path)
+            self.__meta.revision_date = file_ops.date()
+            future = _saver.submit(
+                self._write_serialized,
+                next(_save_order),
+                file_ops.serialize(self._convert_to_dict()),
+            )
+        else:
+            future = Future()
+            future.set_result(None)
         self.__edited = False
-        logging.info(f"Saved {Path(self.path).parts[-1]}.")
+        logger.info("Saving %s in the background.", self.__file_name)
+        return future
+
+    def _write_serialized(self, order: int, data: bytes) -> None:
+        """Writes the serialized dictionary to its associated file, marking
+        it as edited again if the write fails.
+
+        Parameters
+        ----------
+        order : int
+            The number of the save, taken from ``_save_order``.
+        data : bytes
+            The serialized dictionary, as returned by ``file_ops.serialize``.
+        """
+        try:
+            _write_in_order(order, data, self.path)
+        except Exception:
+            self.__edited = True
+            raise
 
     def information_on(
         self, keyword: str, about: InfoType
@@ -220,41 +589,87 @@ class Dictionary(dict):
             The reference of the keyword, by default ``''``
         """
 
+        is_new = self._add(keyword, definition, reference)
+
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        if is_new:
+            logger.info("Added the keyword '%s' to the dictionary.", keyword)
+        if definition:
+            logger.info(
+                "Added the definition '%s' to the keyword '%s'.",
+                definition,
+                keyword,
+            )
+        if reference:
+            logger.info(
+                "Added the reference '%s' to the keyword '%s'.",
+                reference,
+                keyword,
+            )
+
+    def add_many(self, entries: Iterable[tuple[str, str, str]]) -> None:
+        """Adds several contents to the dictionary, each as ``add`` would,
+        logging a single summary instead of each addition.
+
+        Parameters
+        ----------
+        entries : Iterable[tuple[str, str, str]]
+            The keyword, definition, and reference of each content. Either
+            the definition or the reference may be blank.
+
+        Raises
+        ------
+        ValueError
+            Raised if an entry has neither a definition nor a reference. The
+            entries before it are still added.
+        """
+        count = 0
+        for keyword, definition, reference in entries:
+            self._add(keyword, definition, reference)
+            count += 1
+        logger.info("Added %d entries to the dictionary.", count)
+
+    def _add(self, keyword: str, definition: str, reference: str) -> bool:
+        """Adds content to the dictionary without logging it.
+
+        Parameters
+        ----------
+        keyword : str
+            The keyword whose contents are to be added.
+        definition : str
+            The definition of the keyword, which may be blank.
+        reference : str
+            The reference of the keyword, which may be blank.
+
+        Returns
+        -------
+        bool
+            Returns ``True`` if the keyword is new, and ``False`` otherwise.
+
+        Raises
+        ------
+        ValueError
+            Raised if both the definition and the reference are blank.
+        """
         if not (definition or reference):
             raise ValueError("No passed content")
 
-        if keyword in self:
-            if definition:
-                self[keyword]["definitions"].append(definition)
-                logging.info(
-                    f"Added the definition '{definition}' to the keyword"
-                    f" '{keyword}'."
-                )
-            if reference:
-                self[keyword]["references"].append(reference)
-                logging.info(
-                    f"Added the reference '{reference}' to the keyword"
-                    f" '{keyword}'."
-                )
-
-        else:
-            new_definitions = [definition] if definition else []
-            new_references = [reference] if reference else []
-            new_entry: dict[str, bool | list[str]] = {
-                "definitions": new_definitions,
-                "references": new_references,
+        entry = self.get(keyword)
+        if entry is None:
+            new_entry: dict[str, list[str]] = {
+                "definitions": [definition] if definition else [],
+                "references": [reference] if reference else [],
             }
             self[keyword] = new_entry
-
-            logging.info(f"Added the keyword '{keyword}' to the dictionary.")
-
+        else:
             if definition:
-                logging.info(
-                    f"Added the definition '{definition}' to the keyword "
-                    f"'{keyword}'."
-                )
+                entry["definitions"].append(definition)
+            if reference:
+                entry["references"].append(reference)
 
         self.__edited = True
+        return entry is None
 
     def remove(
         self, keyword: str, definition: str = "", reference: str = ""
@@ -283,18 +698,20 @@ class Dictionary(dict):
             raise ValueError("Nonexistent entry to be removed")
 
         if definition or reference:
+            entry = self[keyword]
             if definition:
-                if definition in self[keyword]["definitions"]:
-                    self[keyword]["definitions"].remove(definition)
-                else:
-                    raise ValueError("Given definition not found")
+                try:
+                    entry["definitions"].remove(definition)
+                except ValueError:
+                    raise ValueError("Given definition not found") from None
             if reference:
-                if reference in self[keyword]["references"]:
-                    self[keyword]["references"].remove(reference)
-                else:
-                    raise ValueError("Given reference not found")
+                try:
+                    entry["references"].remove(reference)
+                except ValueError:
+                    raise ValueError("Given reference not found") from None
         else:
             super().__delitem__(keyword)
+            self._keys_changed()
 
         self.__edited = True
 
@@ -316,30 +733,40 @@ class Dictionary(dict):
         keyword = keyword if case_sensitive else keyword.lower()
 
         if mode == SearchMode.Exact:
-            if keyword in (self if case_sensitive else map(str.lower, self)):
-                return [(keyword, 0)]
-
-        elif mode == SearchMode.SubStr:
-            regex = re.compile(keyword if case_sensitive else f"(?i){keyword}")
+            if case_sensitive:
+                return [(keyword, 0)] if keyword in self else None
+            lower_index = self._lowercase_index()
+            if keyword in lower_index:
+                return [(lower_index[keyword], 0)]
+            return None
 
-            search_result = [
-                (key, damerau_levenshtein_distance(keyword, key))
-                for key in self
-                if regex.search(key)
-            ][: max_results]
+        cache_key = (keyword, case_sensitive, mode, max_results)
+        if cache_key in self.__search_cache:
+            return list(self.__search_cache[cache_key])
+
+        keys = self._keys()
+        compared = keys if case_sensitive else self._lowercase_keys()
+
+        if mode == SearchMode.SubStr:
+            matches = [
+                index
+                for index, string in enumerate(compared)
+                if keyword in string
+            ]
+            search_result = _closest(
+                keyword,
+                [keys[index] for index in matches],
+                [compared[index] for index in matches],
+                max_results,
+            )
 
         elif mode == SearchMode.Approx:
-            search_result = [
-                (
-                    key,
-                    damerau_levenshtein_distance(
-                        keyword, key if case_sensitive else key.lower()
-                    ),
-                )
-                for key in self
-            ][: max_results]
+            search_result = _closest(keyword, keys, compared, max_results)
 
         if search_result is not None:
-            search_result.sort(key=lambda t: t[1])
+            if len(self.__search_cache) >= _SEARCH_CACHE_SIZE:
+                del self.__search_cache[next(iter(self.__search_cache))]
+            self.__search_cache[cache_key] = search_result
+            search_result = list(search_result)
 
         return search_result
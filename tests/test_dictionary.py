@@ -1,7 +1,18 @@
+import atexit
+import copy
 import json
+import logging
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import weakref
+
 import pytest
 
 from dictionary.main import Dictionary, InfoType, SearchMode
+from dictionary import file_ops, main
 from dictionary.file_ops import NotADictionaryError, read_json, time, date_time
 from datetime import date as date_
 from pathlib import Path
@@ -10,6 +21,9 @@ file = Path("dict-test.json")
 if file.exists():
     file.unlink()
 
+if Path("dict-test4.json").exists():
+    Path("dict-test4.json").unlink()
+
 test_dict = Dictionary("dict-test.json", "title", "author", "description")
 
 
@@ -32,6 +46,15 @@ with open('dict-test3.json', 'w') as f:
         'key1': 'value1'
     }, f)
 
+with open('dict-test5.json', 'w') as f:
+    json.dump({
+        'title': 'title',
+        'author': 'author',
+        'description': 'description',
+        'revision_date': str(date_.today()),
+        'contents': []
+    }, f)
+
 
 def test_new():
     assert test_dict.title == "title"
@@ -73,6 +96,42 @@ def test_add():
         test_dict.add('new')
 
 
+def test_add_logging(caplog):
+    log_dict = Dictionary("temp.json", "title", "author", "description")
+    with caplog.at_level(logging.INFO):
+        log_dict.add("keyword1", "definition1", "reference1")
+    assert caplog.messages == [
+        "Added the keyword 'keyword1' to the dictionary.",
+        "Added the definition 'definition1' to the keyword 'keyword1'.",
+        "Added the reference 'reference1' to the keyword 'keyword1'.",
+    ]
+
+
+def test_add_many():
+    many_dict = Dictionary("temp.json", "title", "author", "description")
+    many_dict.add_many(
+        [
+            ("keyword1", "definition1", ""),
+            ("keyword1", "", "reference1"),
+            ("keyword2", "definition2", "reference2"),
+        ]
+    )
+    assert many_dict.edited
+    assert many_dict == {
+        "keyword1": {
+            "definitions": ["definition1"],
+            "references": ["reference1"],
+        },
+        "keyword2": {
+            "definitions": ["definition2"],
+            "references": ["reference2"],
+        },
+    }
+
+    with pytest.raises(ValueError):
+        many_dict.add_many([("keyword3", "", "")])
+
+
 def test_save():
     test_dict.save()
     assert file.exists()
@@ -80,6 +139,72 @@ def test_save():
         assert test_dict._convert_to_dict() == json.load(f)
 
 
+def test_save_async():
+    async_dict = Dictionary("dict-test4.json", "title", "author", "")
+    assert async_dict.save_async().result() is None
+    assert not Path("dict-test4.json").exists()
+
+    async_dict.add("keyword1", "definition1")
+    future = async_dict.save_async()
+    async_dict.add("keyword2", "definition2")
+    future.result()
+    assert async_dict.edited
+    assert read_json("dict-test4.json")["contents"] == {
+        "keyword1": {"definitions": ["definition1"], "references": []}
+    }
+
+    # A pending background save must not overwrite a later synchronous one
+    pending = threading.Event()
+    main._saver.submit(pending.wait)
+    async_dict.add("keyword3", "definition3")
+    future = async_dict.save_async()
+    async_dict.add("keyword4", "definition4")
+    async_dict.save()
+    pending.set()
+    assert future.result() is None
+    assert list(read_json("dict-test4.json")["contents"]) == [
+        "keyword1", "keyword2", "keyword3", "keyword4"
+    ]
+
+    # Saving from a callback of a pending save must not wait on the worker
+    pending = threading.Event()
+    saved = threading.Event()
+    main._saver.submit(pending.wait)
+    async_dict.add("keyword5", "definition5")
+    future = async_dict.save_async()
+    async_dict.add("keyword6", "definition6")
+    future.add_done_callback(lambda _: (async_dict.save(), saved.set()))
+    pending.set()
+    assert saved.wait(5)
+    assert not async_dict.edited
+    assert len(read_json("dict-test4.json")["contents"]) == 6
+
+    failing_dict = Dictionary("missing-dir/dict-test.json", "title", "", "")
+    failing_dict.add("keyword1", "definition1")
+    with pytest.raises(FileNotFoundError):
+        failing_dict.save_async().result()
+    assert failing_dict.edited
+
+
+def test_save_at_exit(tmp_path):
+    path = tmp_path / "dict-test.json"
+    script = (
+        "import atexit\n"
+        "from dictionary.main import Dictionary\n"
+        f"test_dict = Dictionary({str(path)!r})\n"
+        "def save():\n"
+        "    test_dict.add('keyword1', 'definition1')\n"
+        "    test_dict.save()\n"
+        "atexit.register(save)\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.path.abspath("src")},
+    )
+    assert list(read_json(str(path))["contents"]) == ["keyword1"]
+
+
 def test_search():
     for i in ("keyword", "keywords", "keyswords", "keywords1", "keyswords1"):
         test_dict.add(i, "definition1", "reference1")
@@ -92,6 +217,15 @@ def test_search():
         ("keywords1", 2),
     ]
 
+    assert test_dict.search("keyswords1", max_results=1) == [
+        ("keyswords1", 0)
+    ]
+
+    assert test_dict.search("keyswords", max_results=2) == [
+        ("keyswords", 0),
+        ("keywords", 1),
+    ]
+
     assert test_dict.search("keyword", mode=SearchMode.SubStr) == [
         ("keyword", 0),
         ("keyword1", 1),
@@ -99,16 +233,129 @@ def test_search():
         ("keywords1", 2),
     ]
 
+    assert test_dict.search("keyw.rd", mode=SearchMode.SubStr) == []
+
     assert test_dict.search("keyword", mode=SearchMode.Exact) == [
         ("keyword", 0)
     ]
 
+    assert test_dict.search("KEYWORD", mode=SearchMode.Exact) == [
+        ("keyword", 0)
+    ]
+
+    assert test_dict.search(
+        "KEYWORD", case_sensitive=True, mode=SearchMode.Exact
+    ) is None
+
+    assert test_dict.search("nonexistent", mode=SearchMode.Exact) is None
+
     with pytest.raises(ValueError):
         test_dict.search("keyword", max_results=0)
 
     new_dict = Dictionary('temp.json', 'title', 'author', 'description')
     assert new_dict.search('keyword') is None
 
+    new_dict.add('Keyword', 'definition')
+    assert new_dict.search('KEYWORD', mode=SearchMode.Exact) == [
+        ('Keyword', 0)
+    ]
+    new_dict.remove('Keyword')
+    new_dict.add('keyword', 'definition')
+    assert new_dict.search('KEYWORD', mode=SearchMode.Exact) == [
+        ('keyword', 0)
+    ]
+
+    # The transposition makes this 2 rather than the OSA distance of 3
+    new_dict.add('abc', 'definition')
+    assert new_dict.search('ca', max_results=1) == [('abc', 2)]
+
+
+def test_search_cache(monkeypatch):
+    cache_dict = Dictionary('temp.json', 'title', 'author', 'description')
+    cache_dict.add('keyword', 'definition')
+    cache_dict.add('keywords', 'definition')
+
+    result = cache_dict.search('keyword')
+    assert result == [('keyword', 0), ('keywords', 1)]
+    result.clear()
+    assert cache_dict.search('keyword') == [('keyword', 0), ('keywords', 1)]
+
+    cache_dict.add('keywor', 'definition')
+    assert cache_dict.search('keyword', max_results=2) == [
+        ('keyword', 0),
+        ('keywords', 1),
+    ]
+    assert cache_dict.search('keyword') == [
+        ('keyword', 0),
+        ('keywords', 1),
+        ('keywor', 1),
+    ]
+
+    cache_dict.add('Keywor', 'definition')
+    assert cache_dict.search('keywor', mode=SearchMode.Exact) == [
+        ('keywor', 0)
+    ]
+    cache_dict.remove('Keywor')
+
+    assert cache_dict.search('Keywor', case_sensitive=True) == [
+        ('keywor', 1),
+        ('keyword', 2),
+        ('keywords', 3),
+    ]
+    cache_dict.add('KEYWORDS2', 'definition')
+    assert cache_dict.search('keywords2', mode=SearchMode.Exact) == [
+        ('KEYWORDS2', 0)
+    ]
+    assert cache_dict.search('keywords2', max_results=1) == [
+        ('KEYWORDS2', 0)
+    ]
+
+    monkeypatch.setattr(main, '_SEARCH_CACHE_SIZE', 1)
+    assert cache_dict.search('keywor') == [
+        ('keywor', 0),
+        ('keyword', 1),
+        ('keywords', 2),
+        ('KEYWORDS2', 3),
+    ]
+
+
+def test_copy():
+    original = Dictionary('dict-test6.json', 'title', 'author', '')
+    original.add('alpha', 'definition')
+    original.add('beta', 'definition')
+    assert original.search('alpha', max_results=1) == [('alpha', 0)]
+
+    copied = copy.copy(original)
+    assert copied == original
+    assert copied.title == 'title' and copied.edited
+    assert copied['alpha'] is original['alpha']
+
+    copied.add('gamma', 'definition')
+    assert 'gamma' not in original
+    assert original.search('gamma') == [('alpha', 4), ('beta', 4)]
+    assert copied.search('gamma', max_results=1) == [('gamma', 0)]
+
+    deep = copy.deepcopy(original)
+    assert deep == original
+    assert deep['alpha'] is not original['alpha']
+
+
+def test_pickle():
+    original = Dictionary('dict-test6.json', 'title', 'author', '')
+    original.add('alpha', 'definition', 'reference')
+    original.search('alpha')
+
+    restored = pickle.loads(pickle.dumps(original))
+    assert restored == original
+    assert restored.path == 'dict-test6.json'
+    assert restored.title == 'title' and restored.author == 'author'
+    assert restored.revision_date == original.revision_date
+    assert restored.edited
+
+    restored.add('beta', 'definition')
+    assert restored.search('beta', max_results=1) == [('beta', 0)]
+    assert 'beta' not in original
+
 
 def test_information_on():
     assert test_dict.information_on("keyword", InfoType.Definitions) == [
@@ -177,6 +424,57 @@ def test_overrides():
     with pytest.raises(NotImplementedError):
         test_dict['keywords'] = []
 
+
+def test_update():
+    update_dict = Dictionary('dict-test6.json', 'title', 'author', '')
+    update_dict.add('alpha', 'definition')
+    assert update_dict.search('alpha', max_results=1) == [('alpha', 0)]
+    assert update_dict.search('ALPHA', mode=SearchMode.Exact) == [
+        ('alpha', 0)
+    ]
+
+    entry = {'definitions': ['definition'], 'references': []}
+    update_dict.update({'beta': entry})
+    assert update_dict.search('beta', max_results=1) == [('beta', 0)]
+    assert update_dict.search('BETA', mode=SearchMode.Exact) == [
+        ('beta', 0)
+    ]
+
+    assert update_dict.setdefault('gamma', entry) is entry
+    assert update_dict.setdefault('gamma', {}) is entry
+    assert update_dict.search('gamma', max_results=1) == [('gamma', 0)]
+
+    update_dict |= {'delta': entry}
+    assert update_dict.search('delta', max_results=1) == [('delta', 0)]
+    assert isinstance(update_dict, Dictionary)
+
+    with pytest.raises(NotImplementedError):
+        update_dict.update(alpha=entry)
+
+    with pytest.raises(NotImplementedError):
+        update_dict |= {'epsilon': []}
+
+    with pytest.raises(NotImplementedError):
+        update_dict.setdefault('epsilon')
+    assert 'epsilon' not in update_dict
+
+    before = dict(update_dict)
+    with pytest.raises(NotImplementedError):
+        update_dict.update({'epsilon': entry, 'alpha': entry})
+    with pytest.raises(NotImplementedError):
+        update_dict.update({'epsilon': entry, 'zeta': None})
+    assert update_dict == before
+    assert update_dict.search('epsilon', mode=SearchMode.Exact) is None
+
+    with pytest.raises(NotImplementedError):
+        update_dict['epsilon'] = None
+
+
+def test_weakref():
+    weak_dict = Dictionary('dict-test6.json', 'title', 'author', '')
+    assert weakref.ref(weak_dict)() is weak_dict
+
+
 def test_file_validation():
     assert read_json('dict-test2.json') == {
         'title': 'title',
@@ -193,6 +491,9 @@ def test_file_validation():
     with pytest.raises(NotADictionaryError):
         read_json('dict-test3.json')
 
+    with pytest.raises(NotADictionaryError):
+        read_json('dict-test5.json')
+
     with pytest.raises(FileNotFoundError):
         read_json('non-existent-file.json')
 
@@ -204,3 +505,40 @@ def test_file_validation():
     # For the sake of code coverage
     assert time()
     assert date_time()
+
+
+def test_json_fallback(monkeypatch):
+    content = read_json('dict-test2.json')
+    content['contents']['kéyword'] = {
+        'definitions': ['définition', '"quoted"'],
+        'references': [],
+    }
+    serialized = file_ops.serialize(content)
+
+    monkeypatch.setattr(file_ops, 'orjson', None)
+    assert file_ops.serialize(content) == serialized
+
+    # The json module streams the document to the file chunk by chunk
+    file_ops.save_all_to_file(content, 'dict-test6.json')
+    assert Path('dict-test6.json').read_bytes() == serialized
+    assert read_json('dict-test6.json') == content
+
+
+def test_config_log():
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    try:
+        file_ops.config_log("dict-test-log.json")
+        logging.info("Logged in the background.")
+        file_ops._log_listener.stop()
+        atexit.unregister(file_ops._log_listener.stop)
+        with open("dict-test-log.log") as f:
+            assert f.read().endswith("[INFO] Logged in the background.\n")
+    finally:
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        for handler in handlers:
+            root.addHandler(handler)